@@ -4,24 +4,31 @@ Manorama Online Dynamic News Scraper
 Scrapes news data for ML training with engagement metrics
 """
 
-import requests
 from bs4 import BeautifulSoup
+import numpy as np
 import pandas as pd
-import json
+import pyarrow as pa
+import pyarrow.parquet as pq
+import orjson
 import time
 import random
 from datetime import datetime, timedelta
 import re
 import logging
 import os
-from urllib.parse import urljoin, urlparse
+import pickle
+from urllib.parse import urljoin, urlsplit
 import schedule
-from fake_useragent import UserAgent
+from aiolimiter import AsyncLimiter
+from dateutil import parser as date_parser
+from html5_parser import parse as html5_parse
+from pybloom_live import ScalableBloomFilter
+from selectolax.lexbor import LexborHTMLParser
 import csv
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional
 import asyncio
-import aiohttp
+import httpx
 from concurrent.futures import ThreadPoolExecutor
 import threading
 
@@ -35,6 +42,25 @@ logging.basicConfig(
     ]
 )
 
+# Curated modern user agents; a static tuple avoids the disk/network hit
+# fake_useragent pays on instantiation and per .random lookup
+_UA_LIST = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36 Edg/121.0.0.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:122.0) Gecko/20100101 Firefox/122.0',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:122.0) Gecko/20100101 Firefox/122.0',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Mobile Safari/537.36',
+    'Mozilla/5.0 (Linux; Android 13; SM-G991B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
+)
+
 @dataclass
 class NewsArticle:
     headline: str
@@ -51,15 +77,74 @@ class NewsArticle:
     content_length: int
 
 class ManoramaScraper:
-    def __init__(self, base_url="https://www.manoramaonline.com", 
+    # Class tokens recognised during the single DOM walk, mapped to
+    # (field, priority); lower priority wins, mirroring the order of the
+    # old per-field selector lists
+    _CLASS_FIELD_MAP = {
+        'article-title': ('headline', 0),
+        'headline': ('headline', 1),
+        'article-headline': ('headline', 2),
+        'date': ('date', 0),
+        'publish-date': ('date', 1),
+        'article-date': ('date', 2),
+        'location': ('location', 0),
+        'region': ('location', 1),
+        'dateline': ('location', 2),
+        'article-location': ('location', 3),
+        'view-count': ('views', 0),
+        'views': ('views', 1),
+        'comment-count': ('comments', 0),
+        'comments-count': ('comments', 1),
+        'like-count': ('likes', 0),
+        'likes': ('likes', 1),
+        'share-count': ('shares', 0),
+        'shares': ('shares', 1),
+        'article-content': ('content', 0),
+        'content': ('content', 1),
+        'article-body': ('content', 2),
+        'post-content': ('content', 3),
+    }
+
+    # data-* attributes rank below any class-based match (priority 9)
+    _DATA_ATTR_FIELDS = {
+        'data-date': 'date',
+        'data-views': 'views',
+        'data-comments': 'comments',
+        'data-likes': 'likes',
+        'data-shares': 'shares',
+    }
+
+    _NUM_RE = re.compile(r'(\d+)')
+
+    def __init__(self, base_url="https://www.manoramaonline.com",
                  max_articles_per_run=100, 
                  delay_range=(1, 3)):
         self.base_url = base_url
         self.max_articles = max_articles_per_run
         self.delay_range = delay_range
-        self.ua = UserAgent()
-        self.session = requests.Session()
+        self.max_concurrency = 20
+        self.batch_size = 200  # articles buffered before each flush to disk
         self.articles_data = []
+
+        # Cross-cycle URL dedup: a persisted Bloom filter gives O(1)
+        # membership checks in a few KB, so scheduled runs skip articles
+        # they already downloaded
+        self.seen_urls_file = 'seen_urls.bloom'
+        self.seen_urls = self._load_seen_urls()
+
+        # Precompute the static header fields so get_headers() only has
+        # to merge in a user agent per request
+        self._base_headers = {
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': 'gzip, deflate',
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none'
+        }
         
         # Categories to scrape
         self.categories = {
@@ -94,32 +179,43 @@ class ManoramaScraper:
     
     def get_headers(self):
         """Generate random headers to avoid blocking"""
-        return {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none'
-        }
+        return {**self._base_headers, 'User-Agent': random.choice(_UA_LIST)}
     
-    def random_delay(self):
-        """Add random delay between requests"""
-        delay = random.uniform(self.delay_range[0], self.delay_range[1])
-        time.sleep(delay)
-    
-    def extract_article_links(self, category_url: str) -> List[str]:
-        """Extract article links from category page"""
+    def _load_seen_urls(self) -> ScalableBloomFilter:
+        """Load the persisted URL filter, or start a fresh one"""
         try:
-            full_url = urljoin(self.base_url, category_url)
-            response = self.session.get(full_url, headers=self.get_headers())
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if os.path.exists(self.seen_urls_file):
+                with open(self.seen_urls_file, 'rb') as f:
+                    return pickle.load(f)
+        except Exception as e:
+            logging.error(f"Error loading seen URLs filter: {e}")
+        return ScalableBloomFilter(initial_capacity=10_000, error_rate=0.001)
+
+    def _save_seen_urls(self):
+        """Persist the URL filter for the next cycle"""
+        try:
+            with open(self.seen_urls_file, 'wb') as f:
+                pickle.dump(self.seen_urls, f)
+        except Exception as e:
+            logging.error(f"Error saving seen URLs filter: {e}")
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> Optional[str]:
+        """Fetch a URL with bounded concurrency and per-host rate limiting"""
+        try:
+            async with self._semaphore, self._limiter:
+                response = await client.get(url, headers=self.get_headers())
+                response.raise_for_status()
+                # Decode once here (httpx honours the response charset);
+                # everything downstream works on the same str
+                return response.text
+        except Exception as e:
+            logging.error(f"Error fetching {url}: {e}")
+            return None
+
+    def extract_article_links(self, html: str, category_url: str) -> List[str]:
+        """Extract article links from category page HTML"""
+        try:
+            soup = BeautifulSoup(html, 'lxml')
             article_links = []
             
             # Find article links (adjust selectors based on actual site structure)
@@ -131,13 +227,19 @@ class ManoramaScraper:
                 'h2 a, h3 a, h4 a'
             ]
             
+            seen = set()
             for selector in link_selectors:
                 links = soup.select(selector)
                 for link in links:
                     href = link.get('href')
                     if href and self.is_valid_article_url(href):
                         full_link = urljoin(self.base_url, href)
-                        if full_link not in article_links:
+                        # Normalize so /path and /path/ dedupe together
+                        parts = urlsplit(full_link)
+                        full_link = parts._replace(
+                            path=parts.path.rstrip('/') or '/', fragment='').geturl()
+                        if full_link not in seen:
+                            seen.add(full_link)
                             article_links.append(full_link)
             
             logging.info(f"Found {len(article_links)} article links from {category_url}")
@@ -156,31 +258,27 @@ class ManoramaScraper:
         ]
         return not any(pattern in url.lower() for pattern in invalid_patterns)
     
-    def extract_article_data(self, url: str, category: str) -> Optional[NewsArticle]:
-        """Extract data from individual article"""
+    def extract_article_data(self, html: str, url: str, category: str) -> Optional[NewsArticle]:
+        """Extract data from individual article HTML"""
         try:
-            self.random_delay()
-            response = self.session.get(url, headers=self.get_headers())
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract headline
-            headline = self.extract_headline(soup)
+            tree = self.parse_html(html)
+
+            # Single walk over the tree collects every field at once
+            fields = self._collect_fields(tree)
+
+            headline = fields['headline']
             if not headline:
                 return None
-            
-            # Extract other data
-            article_date = self.extract_date(soup)
-            location = self.extract_location(soup, category)
-            views = self.extract_views(soup)
-            comments = self.extract_comments(soup)
-            likes = self.extract_likes(soup)
-            shares = self.extract_shares(soup)
-            content_length = self.extract_content_length(soup)
+
+            article_date = fields['date']
+            location = self._resolve_location(fields['location'], category)
+            views = fields['views']
+            comments = fields['comments']
+            likes = fields['likes']
+            shares = fields['shares']
+            content_length = fields['content_length']
             read_minutes = self.calculate_read_time(content_length)
-            engagement_score = self.calculate_engagement_score(views, comments, likes, shares)
-            
+
             article = NewsArticle(
                 headline=headline,
                 date=article_date,
@@ -189,7 +287,7 @@ class ManoramaScraper:
                 comments=comments,
                 likes=likes,
                 shares=shares,
-                engagement_score=engagement_score,
+                engagement_score=0.0,  # filled in vectorized over the batch
                 read_minutes=read_minutes,
                 category=category,
                 url=url,
@@ -203,325 +301,334 @@ class ManoramaScraper:
             logging.error(f"Error scraping article {url}: {e}")
             return None
     
-    def extract_headline(self, soup: BeautifulSoup) -> str:
-        """Extract article headline"""
-        selectors = [
-            'h1.article-title',
-            'h1.headline',
-            'h1',
-            '.title h1',
-            '.article-headline',
-            'title'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                return element.get_text().strip()
-        return ""
-    
-    def extract_date(self, soup: BeautifulSoup) -> str:
-        """Extract article date"""
-        # Try multiple date selectors
-        date_selectors = [
-            'time[datetime]',
-            '.date',
-            '.publish-date',
-            '.article-date',
-            '[data-date]'
-        ]
-        
-        for selector in date_selectors:
-            element = soup.select_one(selector)
-            if element:
-                # Try datetime attribute first
-                if element.get('datetime'):
-                    return element['datetime']
-                # Then try data-date
-                if element.get('data-date'):
-                    return element['data-date']
-                # Finally try text content
-                date_text = element.get_text().strip()
-                if date_text:
-                    return self.parse_date_string(date_text)
-        
-        # If no date found, use current date
-        return datetime.now().isoformat()
-    
+    def parse_html(self, html: str) -> LexborHTMLParser:
+        """Parse HTML with the fast Lexbor backend, falling back to BS4 for malformed pages"""
+        try:
+            tree = LexborHTMLParser(html)
+            if tree.body is not None:
+                return tree
+        except Exception:
+            pass
+        # Let BeautifulSoup repair the markup, then reparse the cleaned HTML
+        try:
+            return LexborHTMLParser(str(BeautifulSoup(html, 'lxml')))
+        except Exception:
+            # Last resort: html5-parser applies full HTML5 error recovery
+            # in C, far faster than the pure-Python html5lib path
+            return LexborHTMLParser(str(html5_parse(html, treebuilder='soup')))
+
+    def _collect_fields(self, tree: LexborHTMLParser) -> Dict:
+        """Collect all article fields in one pass over the DOM
+
+        Replaces the previous eight independent selector walks with a
+        single traversal that inspects each element's tag, class tokens
+        and data-* attributes.
+        """
+        best = {}  # field -> (priority, node)
+        h1_node = None
+        title_node = None
+        time_node = None
+        paragraph_words = 0
+
+        root = tree.root
+        for node in (root.traverse(include_text=False) if root is not None else ()):
+            tag = node.tag
+            if tag == 'p':
+                paragraph_words += len(node.text().split())
+                continue
+            if tag == 'h1' and h1_node is None:
+                h1_node = node
+            elif tag == 'title' and title_node is None:
+                title_node = node
+            elif tag == 'time' and time_node is None and node.attributes.get('datetime'):
+                time_node = node
+
+            attrs = node.attributes
+            if not attrs:
+                continue
+            class_attr = attrs.get('class')
+            if class_attr:
+                for token in class_attr.split():
+                    hit = self._CLASS_FIELD_MAP.get(token)
+                    if hit:
+                        field, priority = hit
+                        current = best.get(field)
+                        if current is None or priority < current[0]:
+                            best[field] = (priority, node)
+            for attr, field in self._DATA_ATTR_FIELDS.items():
+                if attr in attrs and field not in best:
+                    best[field] = (9, node)
+
+        # Headline: classed element, then first <h1>, then <title>
+        headline = ""
+        headline_hit = best.get('headline')
+        for node in (headline_hit and headline_hit[1], h1_node, title_node):
+            if node is not None:
+                headline = node.text(strip=True)
+                if headline:
+                    break
+
+        # Date: <time datetime> wins, then classed element, then now()
+        if time_node is not None:
+            article_date = time_node.attributes['datetime']
+        else:
+            article_date = datetime.now().isoformat()
+            date_hit = best.get('date')
+            if date_hit:
+                node = date_hit[1]
+                if node.attributes.get('datetime'):
+                    article_date = node.attributes['datetime']
+                elif node.attributes.get('data-date'):
+                    article_date = node.attributes['data-date']
+                elif node.text(strip=True):
+                    article_date = self.parse_date_string(node.text(strip=True))
+
+        location_hit = best.get('location')
+        location_text = location_hit[1].text(strip=True) if location_hit else ""
+
+        content_hit = best.get('content')
+        if content_hit:
+            content_length = len(content_hit[1].text().split())
+        else:
+            # Fallback to all paragraph text
+            content_length = paragraph_words
+
+        return {
+            'headline': headline,
+            'date': article_date,
+            'location': location_text,
+            'views': self._node_int(best.get('views'), 'data-views', (100, 50000)),
+            'comments': self._node_int(best.get('comments'), 'data-comments', (0, 200)),
+            'likes': self._node_int(best.get('likes'), 'data-likes', (0, 1000)),
+            'shares': self._node_int(best.get('shares'), 'data-shares', (0, 500)),
+            'content_length': content_length,
+        }
+
+    def _node_int(self, hit, attr: str, simulated_range: tuple) -> int:
+        """Pull an integer out of a matched node, simulating when absent"""
+        if hit:
+            node = hit[1]
+            text = node.text() or node.attributes.get(attr) or ''
+            match = self._NUM_RE.search(text.replace(',', ''))
+            if match:
+                return int(match.group(1))
+        # Simulate realistic counts if not available
+        return random.randint(*simulated_range)
+
+    def _resolve_location(self, location_text: str, category: str) -> str:
+        """Map scraped location text (or the category) onto a region"""
+        if location_text:
+            location_text = location_text.lower()
+            for key, value in self.location_mapping.items():
+                if key in location_text:
+                    return value
+        # Fallback to category-based location
+        return self.location_mapping.get(category, 'Kerala/General')
+
     def parse_date_string(self, date_str: str) -> str:
         """Parse various date string formats"""
         try:
-            # Common date patterns
-            patterns = [
-                r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})',  # DD/MM/YYYY or DD-MM-YYYY
-                r'(\d{4})[\/\-](\d{1,2})[\/\-](\d{1,2})',  # YYYY/MM/DD
-                r'(\d{1,2})\s+(\w+)\s+(\d{4})',            # DD Month YYYY
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, date_str)
-                if match:
-                    # Convert to standard format
-                    return datetime.now().isoformat()  # Simplified for now
-            
+            return date_parser.parse(date_str, fuzzy=True).isoformat()
+        except (ValueError, OverflowError):
             return datetime.now().isoformat()
-        except:
-            return datetime.now().isoformat()
-    
-    def extract_location(self, soup: BeautifulSoup, category: str) -> str:
-        """Extract location/region information"""
-        # Try to find location in article
-        location_selectors = [
-            '.location',
-            '.region',
-            '.dateline',
-            '.article-location'
-        ]
-        
-        for selector in location_selectors:
-            element = soup.select_one(selector)
-            if element:
-                location_text = element.get_text().strip().lower()
-                for key, value in self.location_mapping.items():
-                    if key in location_text:
-                        return value
-        
-        # Fallback to category-based location
-        return self.location_mapping.get(category, 'Kerala/General')
-    
-    def extract_views(self, soup: BeautifulSoup) -> int:
-        """Extract view count (simulated if not available)"""
-        view_selectors = [
-            '.view-count',
-            '.views',
-            '[data-views]'
-        ]
-        
-        for selector in view_selectors:
-            element = soup.select_one(selector)
-            if element:
-                views_text = element.get_text() or element.get('data-views', '')
-                views = re.search(r'(\d+)', views_text.replace(',', ''))
-                if views:
-                    return int(views.group(1))
-        
-        # Simulate realistic view counts if not available
-        return random.randint(100, 50000)
-    
-    def extract_comments(self, soup: BeautifulSoup) -> int:
-        """Extract comment count"""
-        comment_selectors = [
-            '.comment-count',
-            '.comments-count',
-            '[data-comments]'
-        ]
-        
-        for selector in comment_selectors:
-            element = soup.select_one(selector)
-            if element:
-                comment_text = element.get_text() or element.get('data-comments', '')
-                comments = re.search(r'(\d+)', comment_text.replace(',', ''))
-                if comments:
-                    return int(comments.group(1))
-        
-        # Simulate comment counts
-        return random.randint(0, 200)
-    
-    def extract_likes(self, soup: BeautifulSoup) -> int:
-        """Extract like count"""
-        like_selectors = [
-            '.like-count',
-            '.likes',
-            '[data-likes]'
-        ]
-        
-        for selector in like_selectors:
-            element = soup.select_one(selector)
-            if element:
-                like_text = element.get_text() or element.get('data-likes', '')
-                likes = re.search(r'(\d+)', like_text.replace(',', ''))
-                if likes:
-                    return int(likes.group(1))
-        
-        # Simulate like counts
-        return random.randint(0, 1000)
-    
-    def extract_shares(self, soup: BeautifulSoup) -> int:
-        """Extract share count"""
-        share_selectors = [
-            '.share-count',
-            '.shares',
-            '[data-shares]'
-        ]
-        
-        for selector in share_selectors:
-            element = soup.select_one(selector)
-            if element:
-                share_text = element.get_text() or element.get('data-shares', '')
-                shares = re.search(r'(\d+)', share_text.replace(',', ''))
-                if shares:
-                    return int(shares.group(1))
-        
-        # Simulate share counts
-        return random.randint(0, 500)
-    
-    def extract_content_length(self, soup: BeautifulSoup) -> int:
-        """Extract content length for read time calculation"""
-        content_selectors = [
-            '.article-content',
-            '.content',
-            '.article-body',
-            '.post-content'
-        ]
-        
-        content_text = ""
-        for selector in content_selectors:
-            element = soup.select_one(selector)
-            if element:
-                content_text = element.get_text()
-                break
-        
-        if not content_text:
-            # Fallback to all paragraph text
-            paragraphs = soup.find_all('p')
-            content_text = ' '.join([p.get_text() for p in paragraphs])
-        
-        return len(content_text.split())
     
     def calculate_read_time(self, word_count: int, wpm: int = 200) -> int:
         """Calculate estimated read time in minutes"""
         read_time = max(1, round(word_count / wpm))
         return read_time
     
-    def calculate_engagement_score(self, views: int, comments: int, likes: int, shares: int) -> float:
-        """Calculate engagement score"""
-        if views == 0:
-            return 0.0
-        
-        # Weighted engagement formula
+    def calculate_engagement_scores(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute engagement scores for a whole batch in one NumPy pass"""
+        views = df['views'].to_numpy(dtype=np.float64)
+
+        # Weighted engagement formula: comments weighted heavily,
+        # likes and shares moderate weight
         engagement = (
-            (comments * 0.4) +  # Comments weighted heavily
-            (likes * 0.3) +     # Likes moderate weight
-            (shares * 0.3)      # Shares moderate weight
-        ) / views * 100
-        
-        return round(min(engagement, 100), 2)  # Cap at 100%
-    
+            0.4 * df['comments'].to_numpy(dtype=np.float64) +
+            0.3 * df['likes'].to_numpy(dtype=np.float64) +
+            0.3 * df['shares'].to_numpy(dtype=np.float64)
+        ) / np.maximum(views, 1) * 100
+
+        df['engagement_score'] = np.minimum(engagement, 100).round(2)  # Cap at 100%
+        return df
+
     def scrape_all_categories(self) -> List[NewsArticle]:
-        """Scrape articles from all categories"""
-        all_articles = []
-        
-        for category, category_url in self.categories.items():
-            logging.info(f"Scraping category: {category}")
-            
+        """Scrape articles from all categories into a list"""
+        async def collect():
+            return [article async for article in self.scrape_all_categories_async()]
+        return asyncio.run(collect())
+
+    async def scrape_all_categories_async(self):
+        """Yield articles from all categories as their fetches complete"""
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Politeness is rate-based rather than sleep-based: one request per
+        # average configured delay, while TLS/TCP work still overlaps
+        avg_delay = (self.delay_range[0] + self.delay_range[1]) / 2
+        self._limiter = AsyncLimiter(1, max(avg_delay, 0.1))
+        loop = asyncio.get_running_loop()
+        produced = 0
+
+        # One persistent client per run: keep-alive pools plus HTTP/2
+        # multiplexing avoid a TLS+TCP handshake per article
+        limits = httpx.Limits(max_connections=50, max_keepalive_connections=50)
+        async with httpx.AsyncClient(http2=True, limits=limits,
+                                     timeout=15, follow_redirects=True) as client:
+            # Fetch all category pages concurrently
+            category_items = list(self.categories.items())
+            pages = await asyncio.gather(
+                *(self._fetch(client, urljoin(self.base_url, url))
+                  for _, url in category_items)
+            )
+
+            # Parse links off the event loop and build the article fetch list
+            article_jobs = []
+            for (category, category_url), content in zip(category_items, pages):
+                if content is None:
+                    continue
+                logging.info(f"Scraping category: {category}")
+                links = await loop.run_in_executor(
+                    None, self.extract_article_links, content, category_url)
+                for link in links:
+                    # Skip URLs already fetched in earlier cycles
+                    if link in self.seen_urls:
+                        continue
+                    self.seen_urls.add(link)
+                    article_jobs.append((link, category))
+
+            # Fetch all articles concurrently and yield each parsed article
+            # as soon as its download finishes
+            async def fetch_job(url, category):
+                return url, category, await self._fetch(client, url)
+
+            tasks = [asyncio.ensure_future(fetch_job(url, category))
+                     for url, category in article_jobs]
             try:
-                # Get article links
-                article_links = self.extract_article_links(category_url)
-                
-                # Scrape each article
-                for link in article_links:
-                    article = self.extract_article_data(link, category)
+                for finished in asyncio.as_completed(tasks):
+                    url, category, content = await finished
+                    if content is None:
+                        continue
+                    article = await loop.run_in_executor(
+                        None, self.extract_article_data, content, url, category)
                     if article:
-                        all_articles.append(article)
-                    
-                    # Break if we've reached max articles
-                    if len(all_articles) >= self.max_articles:
+                        yield article
+                        produced += 1
+
+                    # Stop if we've reached max articles
+                    if produced >= self.max_articles:
                         break
-                
-                logging.info(f"Scraped {len([a for a in all_articles if a.category == category])} articles from {category}")
-                
-            except Exception as e:
-                logging.error(f"Error scraping category {category}: {e}")
-                continue
-        
-        return all_articles
-    
-    def save_to_csv(self, articles: List[NewsArticle], filename: str = None):
-        """Save articles data to CSV"""
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"manorama_news_data_{timestamp}.csv"
-        
-        # Convert to DataFrame
-        data = []
-        for article in articles:
-            data.append({
-                'headline': article.headline,
-                'date': article.date,
-                'location': article.location,
-                'views': article.views,
-                'comments': article.comments,
-                'likes': article.likes,
-                'shares': article.shares,
-                'engagement_score': article.engagement_score,
-                'read_minutes': article.read_minutes,
-                'category': article.category,
-                'url': article.url,
-                'content_length': article.content_length
-            })
-        
-        df = pd.DataFrame(data)
-        
-        # Save to CSV
-        df.to_csv(filename, index=False, encoding='utf-8')
-        logging.info(f"Saved {len(articles)} articles to {filename}")
-        
-        return filename
+            finally:
+                for task in tasks:
+                    task.cancel()
     
+    def _flush_batch(self, batch: List[NewsArticle], filename: str, first: bool,
+                     parquet_writer, stats: Dict):
+        """Write one batch of articles to CSV/Parquet and fold in its stats"""
+        df = pd.DataFrame([asdict(article) for article in batch])
+        df = self.calculate_engagement_scores(df)
+
+        df.to_csv(filename, index=False, encoding='utf-8',
+                  mode='w' if first else 'a', header=first)
+        logging.info(f"Saved {len(df)} articles to {filename}")
+
+        # Also emit a Parquet copy: appended row-group by row-group so the
+        # full run never sits in memory
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if parquet_writer is None:
+                parquet_writer = pq.ParquetWriter(
+                    filename.replace('.csv', '.parquet'), table.schema,
+                    compression='zstd')
+            parquet_writer.write_table(table)
+        except Exception as e:
+            logging.error(f"Error writing parquet copy: {e}")
+
+        # Vectorized per-batch reduction folded into the running totals
+        totals = df[['views', 'comments', 'engagement_score']].sum()
+        stats['articles_collected'] += len(df)
+        stats['total_views'] += int(totals['views'])
+        stats['total_comments'] += int(totals['comments'])
+        stats['engagement_sum'] += float(totals['engagement_score'])
+        stats['categories'].update(df['category'].unique())
+        return parquet_writer
+
+    async def _stream_cycle_async(self, filename: str, start_time: datetime) -> int:
+        """Stream articles to disk in batches as they arrive"""
+        stats = {
+            'articles_collected': 0,
+            'total_views': 0,
+            'total_comments': 0,
+            'engagement_sum': 0.0,
+            'categories': set()
+        }
+        batch = []
+        parquet_writer = None
+        first = True
+
+        try:
+            async for article in self.scrape_all_categories_async():
+                batch.append(article)
+                if len(batch) >= self.batch_size:
+                    parquet_writer = self._flush_batch(
+                        batch, filename, first, parquet_writer, stats)
+                    first = False
+                    batch = []
+            if batch:
+                parquet_writer = self._flush_batch(
+                    batch, filename, first, parquet_writer, stats)
+        finally:
+            if parquet_writer is not None:
+                parquet_writer.close()
+
+        if stats['articles_collected']:
+            self.save_scraping_summary(stats, start_time, filename)
+        return stats['articles_collected']
+
     def run_scraping_cycle(self):
         """Run one complete scraping cycle"""
         logging.info("Starting scraping cycle...")
         start_time = datetime.now()
-        
+
         try:
-            articles = self.scrape_all_categories()
-            
-            if articles:
-                filename = self.save_to_csv(articles)
-                
-                # Save summary statistics
-                self.save_scraping_summary(articles, start_time, filename)
-                
-                logging.info(f"Scraping cycle completed. Collected {len(articles)} articles")
-                return len(articles)
+            timestamp = start_time.strftime("%Y%m%d_%H%M%S")
+            filename = f"manorama_news_data_{timestamp}.csv"
+
+            count = asyncio.run(self._stream_cycle_async(filename, start_time))
+            self._save_seen_urls()
+
+            if count:
+                logging.info(f"Scraping cycle completed. Collected {count} articles")
             else:
                 logging.warning("No articles collected in this cycle")
-                return 0
-                
+            return count
+
         except Exception as e:
             logging.error(f"Error in scraping cycle: {e}")
             return 0
-    
-    def save_scraping_summary(self, articles: List[NewsArticle], start_time: datetime, filename: str):
+
+    def save_scraping_summary(self, stats: Dict, start_time: datetime, filename: str):
         """Save scraping session summary"""
         end_time = datetime.now()
         duration = end_time - start_time
-        
+        count = stats['articles_collected']
+
         summary = {
             'timestamp': end_time.isoformat(),
             'duration_minutes': duration.total_seconds() / 60,
-            'articles_collected': len(articles),
+            'articles_collected': count,
             'filename': filename,
-            'categories': list(set(article.category for article in articles)),
-            'avg_engagement': sum(article.engagement_score for article in articles) / len(articles) if articles else 0,
-            'total_views': sum(article.views for article in articles),
-            'total_comments': sum(article.comments for article in articles)
+            'categories': sorted(stats['categories']),
+            'avg_engagement': stats['engagement_sum'] / count if count else 0,
+            'total_views': stats['total_views'],
+            'total_comments': stats['total_comments']
         }
         
-        # Append to summary log
-        summary_file = 'scraping_summary.json'
+        # Append-only NDJSON log: O(1) per cycle instead of re-serializing
+        # the whole history; read back with pd.read_json(path, lines=True)
+        summary_file = 'scraping_summary.ndjson'
         try:
-            if os.path.exists(summary_file):
-                with open(summary_file, 'r') as f:
-                    existing_data = json.load(f)
-            else:
-                existing_data = []
-            
-            existing_data.append(summary)
-            
-            with open(summary_file, 'w') as f:
-                json.dump(existing_data, f, indent=2)
-                
+            with open(summary_file, 'ab') as f:
+                f.write(orjson.dumps(summary) + b'\n')
+
         except Exception as e:
             logging.error(f"Error saving summary: {e}")
 
@@ -2,22 +2,42 @@
 """
 Easy run script for Manorama News Scraper
 """
-import sys
 import os
-import json
+import functools
+import orjson
 import argparse
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from manorama_scraper import main, ManoramaScraper, schedule_scraping
+@functools.lru_cache(maxsize=1)
+def _load_config(path, mtime):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if path.endswith('.msgpack'):
+        import msgpack
+        return msgpack.unpackb(data, raw=False)
+    return orjson.loads(data)
 
 def load_config():
+    # Keyed on the file's mtime, so repeat calls are cache hits and the
+    # config is re-parsed only after it actually changes. The msgpack
+    # copy setup emits parses faster and is preferred, but only while
+    # it is no older than the JSON — a hand-edited JSON wins
     try:
-        with open('scraper_config.json', 'r', encoding="utf-8") as f:
-            return json.load(f)
+        json_mtime = os.stat('scraper_config.json').st_mtime_ns
     except FileNotFoundError:
         return None
+    try:
+        msgpack_mtime = os.stat('scraper_config.msgpack').st_mtime_ns
+        if msgpack_mtime >= json_mtime:
+            return _load_config('scraper_config.msgpack', msgpack_mtime)
+    except (FileNotFoundError, ImportError):
+        pass
+    return _load_config('scraper_config.json', json_mtime)
 
 def quick_run():
+    # Imported here so --help and bad-usage exits never pay for the
+    # scraper's heavy dependency chain (httpx, pandas, pyarrow, ...)
+    from manorama_scraper import ManoramaScraper
+
     config = load_config()
     if not config:
         print("❌ Config file not found. Run setup_scraper.py first!")
@@ -32,6 +52,8 @@ def quick_run():
     print(f"✅ Completed! Scraped {count} articles")
 
 def scheduled_run():
+    from manorama_scraper import ManoramaScraper, schedule_scraping
+
     config = load_config()
     if not config:
         print("❌ Config file not found. Run setup_scraper.py first!")
@@ -1,179 +1,168 @@
+import hashlib
 import os
+import re
+import shutil
 import sys
+import sysconfig
 import subprocess
 import json
+import py_compile
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+
+_REQ_NAME_RE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]*')
+_STAMP_FILE = '.install_stamp'
+
+def _requirements_hash():
+    """Hash requirements.txt together with the active interpreter/venv"""
+    try:
+        with open('requirements.txt', 'rb') as f:
+            payload = f.read()
+    except OSError:
+        return None
+    payload += f"{sys.version_info}:{sys.prefix}".encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def requirements_satisfied():
+    """Check installed packages directly, skipping pip's cold start"""
+    try:
+        with open('requirements.txt', encoding='utf-8') as f:
+            lines = [line.strip() for line in f]
+    except FileNotFoundError:
+        return False
+    for line in lines:
+        if not line or line.startswith('#'):
+            continue
+        match = _REQ_NAME_RE.match(line)
+        if not match:
+            continue
+        try:
+            metadata.version(match.group(0))
+        except metadata.PackageNotFoundError:
+            return False
+    return True
 
 def install_requirements():
     """Install required packages"""
+    # Fastest path: a stamp recording the requirements hash from the last
+    # successful install means nothing can have changed
+    stamp = _requirements_hash()
+    try:
+        with open(_STAMP_FILE, encoding='utf-8') as f:
+            if stamp and f.read().strip() == stamp:
+                print("✅ Requirements unchanged since last install!")
+                return True
+    except OSError:
+        pass
+
+    # Fast path: every requirement already importable, no subprocess needed
+    if requirements_satisfied():
+        print("✅ Requirements already satisfied!")
+        return True
+
     print("Installing required packages...")
+    env = {**os.environ, 'PIP_DISABLE_PIP_VERSION_CHECK': '1'}
+    if shutil.which('uv'):
+        # uv reuses cached wheels and skips pip's startup cost entirely
+        cmd = ['uv', 'pip', 'install', '--system', '-r', 'requirements.txt']
+    else:
+        # --no-compile skips pip's serial bytecode pass; compileall -j 0
+        # below redoes it across all cores
+        cmd = [sys.executable, '-m', 'pip', 'install', '--prefer-binary',
+               '--no-compile',
+               '--cache-dir', os.path.expanduser('~/.cache/pip'),
+               '-r', 'requirements.txt']
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        # close_fds=False (with no preexec_fn/pass_fds) lets CPython spawn
+        # the child via posix_spawn instead of fork+exec, skipping the
+        # page-table copy of this process; pip inherits no sensitive fds
+        subprocess.run(cmd, env=env, check=True, close_fds=False)
+        if not os.environ.get('SCRAPER_SKIP_COMPILEALL'):
+            subprocess.run(
+                [sys.executable, '-m', 'compileall', '-q', '-j', '0',
+                 sysconfig.get_paths()['purelib']],
+                env=env, close_fds=False)
+        if stamp:
+            with open(_STAMP_FILE, 'w', encoding='utf-8') as f:
+                f.write(stamp)
         print("✅ Requirements installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Error installing requirements: {e}")
         return False
 
-def create_config():
-    """Create configuration file"""
-    config = {
-        "scraper_settings": {
-            "max_articles_per_run": 150,
-            "delay_range": [1, 3],
-            "schedule_hours": 6,
-            "base_url": "https://www.manoramaonline.com"
-        },
-        "categories": {
-            "kerala": "/news/kerala.html",
-            "india": "/news/india.html", 
-            "world": "/news/world.html",
-            "sports": "/sports.html",
-            "movies": "/movies.html",
-            "business": "/business.html",
-            "health": "/health.html",
-            "technology": "/tech.html"
-        },
-        "output_settings": {
-            "csv_folder": "scraped_data",
-            "log_folder": "logs",
-            "backup_enabled": True,
-            "max_files_to_keep": 30
-        }
+_DEFAULT_CONFIG = {
+    "scraper_settings": {
+        "max_articles_per_run": 150,
+        "delay_range": [1, 3],
+        "schedule_hours": 6,
+        "base_url": "https://www.manoramaonline.com"
+    },
+    "categories": {
+        "kerala": "/news/kerala.html",
+        "india": "/news/india.html",
+        "world": "/news/world.html",
+        "sports": "/sports.html",
+        "movies": "/movies.html",
+        "business": "/business.html",
+        "health": "/health.html",
+        "technology": "/tech.html"
+    },
+    "output_settings": {
+        "csv_folder": "scraped_data",
+        "log_folder": "logs",
+        "backup_enabled": True,
+        "max_files_to_keep": 30
     }
-    
-    with open('scraper_config.json', 'w', encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
-    
-    print("✅ Configuration file created!")
-
-def create_directories():
-    """Create necessary directories"""
-    for dir_name in ['scraped_data', 'logs', 'backups']:
-        os.makedirs(dir_name, exist_ok=True)
-    print("✅ Directories created!")
-
-def create_run_script():
-    """Create run script for easy execution"""
-    run_script = '''#!/usr/bin/env python3
-"""
-Easy run script for Manorama News Scraper
-"""
-import sys
-import os
-import json
-import argparse
+}
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from manorama_scraper import main, ManoramaScraper, schedule_scraping
+# Serialized once at import time; create_config only has bytes to write
+_DEFAULT_CONFIG_JSON = json.dumps(
+    _DEFAULT_CONFIG, indent=2, ensure_ascii=False).encode('utf-8')
 
-def load_config():
-    try:
-        with open('scraper_config.json', 'r', encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None
-
-def quick_run():
-    config = load_config()
-    if not config:
-        print("❌ Config file not found. Run setup_scraper.py first!")
-        return
-    settings = config['scraper_settings']
-    scraper = ManoramaScraper(
-        max_articles_per_run=settings['max_articles_per_run'],
-        delay_range=settings['delay_range']
-    )
-    print("🚀 Starting quick scraping run...")
-    count = scraper.run_scraping_cycle()
-    print(f"✅ Completed! Scraped {count} articles")
-
-def scheduled_run():
-    config = load_config()
-    if not config:
-        print("❌ Config file not found. Run setup_scraper.py first!")
-        return
-    settings = config['scraper_settings']
-    scraper = ManoramaScraper(
-        max_articles_per_run=settings['max_articles_per_run'],
-        delay_range=settings['delay_range']
-    )
-    print(f"📅 Starting scheduled scraping every {settings['schedule_hours']} hours...")
-    schedule_scraping(scraper, settings['schedule_hours'])
-
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--quick', action='store_true', help='Quick single run')
-    parser.add_argument('--schedule', action='store_true', help='Scheduled runs')
-    args = parser.parse_args()
+def create_config():
+    """Create configuration file"""
+    # Single binary write of the pre-serialized bytes; writing to a temp
+    # file and os.replace-ing keeps the config crash-safe — a
+    # half-written file can never be what load_config sees
+    data = _DEFAULT_CONFIG_JSON
+    tmp = 'scraper_config.json.tmp'
+    with open(tmp, 'wb', buffering=max(len(data), 65536)) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, 'scraper_config.json')
 
-    if args.quick:
-        quick_run()
-    elif args.schedule:
-        scheduled_run()
-    else:
-        print("Usage: python run_scraper.py [--quick | --schedule]")
-'''
-    
-    with open('run_scraper.py', 'w', encoding="utf-8") as f:
-        f.write(run_script)
+    # Also emit a msgpack copy for the runner to parse; JSON stays the
+    # human-editable source of truth. msgpack only exists after
+    # install_requirements, so setup itself never depends on it
     try:
-        os.chmod('run_scraper.py', 0o755)
-    except:
+        import msgpack
+    except ImportError:
         pass
-    print("✅ Run script created!")
-
-def create_data_merger():
-    """Create script to merge CSV files"""
-    merger_script = '''#!/usr/bin/env python3
-"""
-Merge multiple CSV files from scraping sessions
-"""
-import pandas as pd
-import glob
-import os
-from datetime import datetime
+    else:
+        packed = msgpack.packb(_DEFAULT_CONFIG, use_bin_type=True)
+        tmp = 'scraper_config.msgpack.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(packed)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, 'scraper_config.msgpack')
 
-def merge_csv_files(folder_path="scraped_data", output_name=None):
-    csv_files = glob.glob(os.path.join(folder_path, "*.csv"))
-    if not csv_files:
-        print("❌ No CSV files found!")
-        return
-    print(f"📁 Found {len(csv_files)} CSV files")
-    dfs = []
-    for file in csv_files:
-        try:
-            df = pd.read_csv(file)
-            df['source_file'] = os.path.basename(file)
-            dfs.append(df)
-            print(f"✅ Loaded {file}: {len(df)} articles")
-        except Exception as e:
-            print(f"❌ Error loading {file}: {e}")
-    if not dfs:
-        return
-    merged_df = pd.concat(dfs, ignore_index=True)
-    merged_df = merged_df.drop_duplicates(subset=['headline', 'date'], keep='first')
-    if not output_name:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_name = f"merged_manorama_data_{timestamp}.csv"
-    merged_df.to_csv(output_name, index=False)
-    print(f"💾 Saved to: {output_name}")
+    print("✅ Configuration file created!")
 
-if __name__ == "__main__":
-    import argparse
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--folder', default='scraped_data', help='Folder containing CSV files')
-    parser.add_argument('--output', help='Output filename')
-    args = parser.parse_args()
-    merge_csv_files(args.folder, args.output)
-'''
-    
-    with open('merge_data.py', 'w', encoding="utf-8") as f:
-        f.write(merger_script)
-    try:
-        os.chmod('merge_data.py', 0o755)
-    except:
-        pass
-    print("✅ Data merger script created!")
+def create_directories():
+    """Create necessary directories"""
+    # One scandir pass replaces a stat+mkdir syscall pair per directory
+    # on re-runs; DirEntry names come from the single directory read
+    existing = {entry.name for entry in os.scandir('.')}
+    for dir_name in ('scraped_data', 'logs', 'backups'):
+        if dir_name not in existing:
+            try:
+                os.mkdir(dir_name)
+            except FileExistsError:
+                pass
+    print("✅ Directories created!")
 
 def main():
     print("🔧 Setting up Manorama News Scraper...")
@@ -181,10 +170,23 @@ def main():
     if not install_requirements():
         print("❌ Setup failed! Please install requirements manually.")
         return
-    create_config()
-    create_directories()
-    create_run_script()
-    create_data_merger()
+    # These tasks touch disjoint paths and block on disk syscalls (which
+    # release the GIL), so their latencies overlap on a small pool
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tasks = [executor.submit(task) for task in
+                 (create_config, create_directories)]
+        for task in tasks:
+            task.result()
+    # run_scraper.py and merge_data.py ship as static modules now; warm
+    # their bytecode along with the scraper so first runs start from
+    # __pycache__. Both optimize levels are cached: 0 for plain
+    # `python`, 2 for `python -OO` runs that strip asserts/docstrings
+    for module in ('manorama_scraper.py', 'run_scraper.py', 'merge_data.py'):
+        for optimize in (0, 2):
+            try:
+                py_compile.compile(module, quiet=1, optimize=optimize)
+            except Exception:
+                pass
     print("\n" + "=" * 50)
     print("✅ Setup completed successfully!")
     print("\n📋 Next steps:")